@@ -49,9 +49,9 @@ func runInstall(ctx context.Context, args []string, stdout, stderr io.Writer) in
 		opts.Log = func(format string, a ...any) {
 			_ = enc.Encode(jsonEvent{Event: "log", Message: fmt.Sprintf(format, a...)})
 		}
-		opts.Progress = func(downloaded, total int64) {
+		opts.Progress = throttleProgress(func(downloaded, total int64) {
 			_ = enc.Encode(jsonEvent{Event: "progress", Downloaded: downloaded, Total: total})
-		}
+		})
 	} else {
 		opts.Log = func(format string, a ...any) {
 			fmt.Fprintf(stderr, format+"\n", a...)
@@ -84,6 +84,30 @@ func runInstall(ctx context.Context, args []string, stdout, stderr io.Writer) in
 	return 0
 }
 
+// throttleProgress forwards the opening (0-byte) report of each download,
+// updates that advance a whole percent (or another MiB when the total is
+// unknown), and the completion report (downloaded == total).
+// streamWithProgress calls back after every Read (up to 64 KiB each),
+// which would otherwise encode thousands of JSON events per artifact.
+func throttleProgress(fn bootstrap.ProgressFunc) bootstrap.ProgressFunc {
+	lastStep := int64(-1)
+	return func(downloaded, total int64) {
+		if downloaded == 0 {
+			lastStep = -1 // next artifact or retry started
+		}
+
+		step := downloaded >> 20
+		if total > 0 {
+			step = downloaded * 100 / total
+		}
+		if step == lastStep && downloaded != total {
+			return
+		}
+		lastStep = step
+		fn(downloaded, total)
+	}
+}
+
 type jsonEvent struct {
 	Event      string            `json:"event"`
 	Message    string            `json:"message,omitempty"`
@@ -94,3 +94,69 @@ func TestRunInstall_JSONHappyPath(t *testing.T) {
 		t.Error("expected a terminal summary event in --json output")
 	}
 }
+
+type progressUpdate struct{ downloaded, total int64 }
+
+// feedDownload replays what DownloadAndVerify reports for one artifact:
+// the opening 0-byte report, one per Read, and the completion report
+// when the total was unknown.
+func feedDownload(progress bootstrap.ProgressFunc, size, chunk, total int64) {
+	progress(0, total)
+	for d := min(chunk, size); ; d = min(d+chunk, size) {
+		progress(d, total)
+		if d == size {
+			break
+		}
+	}
+	if total < 0 {
+		progress(size, size)
+	}
+}
+
+func TestThrottleProgress_KnownTotal(t *testing.T) {
+	var got []progressUpdate
+	progress := throttleProgress(func(d, total int64) { got = append(got, progressUpdate{d, total}) })
+
+	const chunk = 64 * 1024
+	const total = 1000 * chunk
+	feedDownload(progress, total, chunk, total)
+
+	if len(got) > 102 {
+		t.Errorf("emitted %d updates for one artifact, want at most 102 (start + one per percent)", len(got))
+	}
+	if last := got[len(got)-1]; last != (progressUpdate{total, total}) {
+		t.Errorf("final update = %+v, want {%d %d}", last, total, total)
+	}
+}
+
+func TestThrottleProgress_UnknownTotal(t *testing.T) {
+	var got []progressUpdate
+	progress := throttleProgress(func(d, total int64) { got = append(got, progressUpdate{d, total}) })
+
+	const size = 3*1024*1024 + 512*1024 // 3.5 MiB
+	feedDownload(progress, size, 64*1024, -1)
+
+	if len(got) > 6 {
+		t.Errorf("emitted %d updates for 3.5 MiB, want at most 6 (start, one per MiB, completion)", len(got))
+	}
+	if last := got[len(got)-1]; last != (progressUpdate{size, size}) {
+		t.Errorf("final update = %+v, want {%d %d}; trailing partial MiB was dropped", last, size, size)
+	}
+}
+
+func TestThrottleProgress_TinyFirstArtifact(t *testing.T) {
+	var got []progressUpdate
+	progress := throttleProgress(func(d, total int64) { got = append(got, progressUpdate{d, total}) })
+
+	feedDownload(progress, 30000, 64*1024, -1)
+	n := len(got)
+	feedDownload(progress, 200*1024, 64*1024, -1)
+
+	next := got[n:]
+	if len(next) == 0 || next[0] != (progressUpdate{0, -1}) {
+		t.Fatalf("next artifact's start was dropped: %+v", next)
+	}
+	if last := got[len(got)-1]; last != (progressUpdate{200 * 1024, 200 * 1024}) {
+		t.Errorf("final update = %+v, want completion of the second artifact", last)
+	}
+}
@@ -43,7 +43,7 @@ func runRuned(ctx context.Context, args []string, stderr io.Writer) int {
 		fmt.Fprintf(stderr,
 			"rune: runed not installed at %s (exit 127).\n"+
 				"Agent recovery: invoke %s, then re-attempt.\n",
-			paths.RunedBinary, bootstrap.AgentInstallRecoveryHint())
+			paths.RunedBinary, paths.AgentInstallRecoveryHint())
 		return 127
 	}
 
@@ -3,6 +3,7 @@ package bootstrap
 import (
 	"encoding/json"
 	"fmt"
+	"maps"
 	"os"
 	"path/filepath"
 	"time"
@@ -71,6 +72,18 @@ func WriteInstalledManifest(paths *Paths, manifestURL string, manifest *Manifest
 	return nil
 }
 
+// Report whether rec already records this install, ignoring InstalledAt.
+// nil-safe so callers can pass a missing record straight through.
+func (rec *InstalledManifest) matches(manifestURL string, manifest *Manifest, artifacts map[string]InstalledArtifact) bool {
+	return rec != nil &&
+		rec.ManifestURL == manifestURL &&
+		rec.ManifestVersion == manifest.Version &&
+		rec.RuneMCPVersion == manifest.RuneMCPVersion &&
+		rec.RunedVersion == manifest.RunedVersion &&
+		rec.Platform == PlatformTuple() &&
+		maps.Equal(rec.Artifacts, artifacts)
+}
+
 func ReadInstalledManifest(paths *Paths) (*InstalledManifest, error) {
 	data, err := os.ReadFile(paths.InstalledManifest)
 	if err != nil {
@@ -28,6 +28,10 @@ func newDownloadTransport() *http.Transport {
 	return t
 }
 
+// Called with (0, total) when a download starts, after every Read, and
+// with (written, written) on completion when Content-Length was unknown,
+// so consumers can tell downloads apart and always see the final size.
+// total is -1 while unknown.
 type ProgressFunc func(downloaded, total int64)
 
 // maxDownloadAttempts caps retries for a single network fetch (manifest
@@ -120,6 +124,10 @@ func DownloadAndVerify(ctx context.Context, spec ArtifactSpec, destPath string,
 	wd := time.AfterFunc(stallTimeout, cancel)
 	defer wd.Stop()
 
+	if progress != nil {
+		progress(0, total)
+	}
+
 	written, err := streamWithProgress(resp.Body, f, h, total, func(d, t int64) {
 		wd.Reset(stallTimeout)
 		if progress != nil {
@@ -129,6 +137,9 @@ func DownloadAndVerify(ctx context.Context, spec ArtifactSpec, destPath string,
 	if err != nil {
 		return fmt.Errorf("download: write %s: %w", partial, err)
 	}
+	if total < 0 && progress != nil {
+		progress(written, written) // size known now
+	}
 	if spec.Size > 0 && written != spec.Size {
 		return fmt.Errorf("download: size mismatch: got %d bytes, manifest claims %d", written, spec.Size)
 	}
@@ -113,6 +113,36 @@ func TestDownloadAndVerify_ProgressCallbackInvoked(t *testing.T) {
 	}
 }
 
+func TestDownloadAndVerify_ProgressUnknownLength(t *testing.T) {
+	body := bytes.Repeat([]byte("x"), 200*1024)
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		// Flushing before the body is complete forces chunked encoding (ContentLength -1)
+		_, _ = w.Write(body[:1024])
+		w.(http.Flusher).Flush()
+		_, _ = w.Write(body[1024:])
+	}))
+	defer srv.Close()
+
+	dest := filepath.Join(t.TempDir(), "out.bin")
+	spec := ArtifactSpec{URL: srv.URL, SHA256: sha256Hex(body)}
+
+	type update struct{ downloaded, total int64 }
+	var got []update
+	err := DownloadAndVerify(context.Background(), spec, dest, func(downloaded, total int64) {
+		got = append(got, update{downloaded, total})
+	})
+	if err != nil {
+		t.Fatalf("DownloadAndVerify: %v", err)
+	}
+	if first := got[0]; first != (update{0, -1}) {
+		t.Errorf("first report = %+v, want {0 -1} (download start)", first)
+	}
+	want := int64(len(body))
+	if last := got[len(got)-1]; last != (update{want, want}) {
+		t.Errorf("last report = %+v, want {%d %d} (completion with size known)", last, want, want)
+	}
+}
+
 func TestFileSHA256_KnownContent(t *testing.T) {
 	dir := t.TempDir()
 	path := filepath.Join(dir, "f")
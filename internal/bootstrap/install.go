@@ -115,17 +115,25 @@ func Install(ctx context.Context, opts InstallOptions) (*Result, error) {
 	}
 
 	// Get previous installed info
+	prior, perr := ReadInstalledManifest(paths)
+	if perr != nil {
+		prior = nil
+	}
 	recordedDestSHA := map[string]string{}
-	if prior, perr := ReadInstalledManifest(paths); perr == nil && prior != nil {
+	if prior != nil {
 		for step, a := range prior.Artifacts {
 			recordedDestSHA[step] = a.DestSHA256
 		}
 	}
 
+	verifiedDestSHA := map[string]string{} // dest hashes already computed by the skip check
 	for i, in := range installs {
 		stepNum := i + 2 // step 1: manifest
 		if !opts.Force && fileExists(in.dest) {
-			if skipExistingArtifact(in.step, in.spec, in.dest, recordedDestSHA[in.step], stepNum, total, logf) {
+			if skip, got := skipExistingArtifact(in.step, in.spec, in.dest, recordedDestSHA[in.step], stepNum, total, logf); skip {
+				if got != "" {
+					verifiedDestSHA[in.step] = got
+				}
 				r.Completed = append(r.Completed, in.step)
 				r.Skipped = append(r.Skipped, in.step)
 
@@ -165,7 +173,9 @@ func Install(ctx context.Context, opts InstallOptions) (*Result, error) {
 
 			entry.DestSHA256 = in.spec.SHA256 // record on-disk binary hash for later verification
 			if in.spec.Extract != "" {
-				if h, hErr := FileSHA256(in.dest); hErr == nil {
+				if h, ok := verifiedDestSHA[in.step]; ok {
+					entry.DestSHA256 = h // skip check just hashed it; don't re-read the binary
+				} else if h, hErr := FileSHA256(in.dest); hErr == nil {
 					entry.DestSHA256 = h
 				} else {
 					entry.DestSHA256 = "" // leave as unverified
@@ -176,7 +186,11 @@ func Install(ctx context.Context, opts InstallOptions) (*Result, error) {
 			auditArtifacts[in.step] = entry
 		}
 
-		if err := WriteInstalledManifest(paths, opts.ManifestURL, manifest, auditArtifacts); err != nil {
+		// Keep installed.json (and its installed_at) untouched on a no-op re-install;
+		// any download (--force, repair) must still move installed_at forward
+		if len(r.Installed) == 0 && prior.matches(opts.ManifestURL, manifest, auditArtifacts) {
+			logf("audit: installed.json unchanged at %s", paths.InstalledManifest)
+		} else if err := WriteInstalledManifest(paths, opts.ManifestURL, manifest, auditArtifacts); err != nil {
 			logf("warning: installed.json write failed: %v", err) // not fatal error
 		} else {
 			logf("audit: installed.json updated at %s", paths.InstalledManifest)
@@ -261,27 +275,28 @@ func installArtifact(ctx context.Context, paths *Paths, spec ArtifactSpec, dest
 	}
 }
 
-func skipExistingArtifact(step string, spec ArtifactSpec, dest, recordedDestSHA string, stepNum, total int, logf func(string, ...any)) bool {
+// Returns whether dest can be reused, and its sha256 when one was computed to decide
+func skipExistingArtifact(step string, spec ArtifactSpec, dest, recordedDestSHA string, stepNum, total int, logf func(string, ...any)) (bool, string) {
 	expected, ref := spec.SHA256, "manifest" // installed from raw binary
 	if spec.Extract != "" {
 		expected, ref = recordedDestSHA, "installed.json" // installed from tarball artifact
 	}
 	if expected == "" {
 		logf("[%d/%d] %s: skipped (already at %s; no recorded sha256 to verify)", stepNum, total, step, dest)
-		return true
+		return true, ""
 	}
 
 	got, err := FileSHA256(dest)
 	switch {
 	case err != nil:
 		logf("[%d/%d] %s: cannot verify existing %s (%v); re-downloading", stepNum, total, step, dest, err)
-		return false
+		return false, ""
 	case !strings.EqualFold(got, expected):
 		logf("[%d/%d] %s: existing %s failed sha256 check vs %s (got %s, want %s); re-downloading", stepNum, total, step, dest, ref, got, expected)
-		return false
+		return false, ""
 	default:
 		logf("[%d/%d] %s: skipped (already at %s, sha256 verified vs %s)", stepNum, total, step, dest, ref)
-		return true
+		return true, got
 	}
 }
 
@@ -164,6 +164,50 @@ func TestInstall_Idempotent_SkipsExistingBinaries(t *testing.T) {
 	}
 }
 
+func TestInstall_Idempotent_KeepsInstalledManifest(t *testing.T) {
+	setRealms(t)
+	fx := newFixture(t)
+	paths, err := Resolve()
+	if err != nil {
+		t.Fatalf("Resolve: %v", err)
+	}
+
+	if _, err := Install(context.Background(), InstallOptions{ManifestURL: fx.manifestURL()}); err != nil {
+		t.Fatalf("first install: %v", err)
+	}
+
+	// Pin installed_at to a sentinel so any rewrite is detectable
+	rec, err := ReadInstalledManifest(paths)
+	if err != nil {
+		t.Fatalf("read installed.json: %v", err)
+	}
+	const sentinel = "2000-01-01T00:00:00Z"
+	rec.InstalledAt = sentinel
+	data, err := json.MarshalIndent(rec, "", "  ")
+	if err != nil {
+		t.Fatalf("marshal installed.json: %v", err)
+	}
+	if err := os.WriteFile(paths.InstalledManifest, data, 0o600); err != nil {
+		t.Fatalf("rewrite installed.json: %v", err)
+	}
+
+	r, err := Install(context.Background(), InstallOptions{ManifestURL: fx.manifestURL()})
+	if err != nil {
+		t.Fatalf("second install: %v", err)
+	}
+	if r.Status != "no_op" {
+		t.Fatalf("Status=%q, want no_op", r.Status)
+	}
+
+	got, err := ReadInstalledManifest(paths)
+	if err != nil {
+		t.Fatalf("read installed.json: %v", err)
+	}
+	if got.InstalledAt != sentinel {
+		t.Errorf("installed.json rewritten on no-op install: installed_at=%q, want %q", got.InstalledAt, sentinel)
+	}
+}
+
 func TestInstall_RepairCorruptBinary(t *testing.T) {
 	rune, _ := setRealms(t)
 	fx := newFixture(t)
@@ -366,6 +410,50 @@ func TestInstall_Force_ReDownloadsAllBinaries(t *testing.T) {
 	}
 }
 
+func TestInstall_Force_RewritesInstalledManifest(t *testing.T) {
+	setRealms(t)
+	fx := newFixture(t)
+	paths, err := Resolve()
+	if err != nil {
+		t.Fatalf("Resolve: %v", err)
+	}
+
+	if _, err := Install(context.Background(), InstallOptions{ManifestURL: fx.manifestURL()}); err != nil {
+		t.Fatalf("first install: %v", err)
+	}
+
+	// Same artifacts will be re-recorded; only installed_at tells the runs apart
+	rec, err := ReadInstalledManifest(paths)
+	if err != nil {
+		t.Fatalf("read installed.json: %v", err)
+	}
+	const sentinel = "2000-01-01T00:00:00Z"
+	rec.InstalledAt = sentinel
+	data, err := json.MarshalIndent(rec, "", "  ")
+	if err != nil {
+		t.Fatalf("marshal installed.json: %v", err)
+	}
+	if err := os.WriteFile(paths.InstalledManifest, data, 0o600); err != nil {
+		t.Fatalf("rewrite installed.json: %v", err)
+	}
+
+	r, err := Install(context.Background(), InstallOptions{ManifestURL: fx.manifestURL(), Force: true})
+	if err != nil {
+		t.Fatalf("force install: %v", err)
+	}
+	if r.Status != "installed" {
+		t.Fatalf("Status=%q, want installed", r.Status)
+	}
+
+	got, err := ReadInstalledManifest(paths)
+	if err != nil {
+		t.Fatalf("read installed.json: %v", err)
+	}
+	if got.InstalledAt == sentinel {
+		t.Errorf("installed.json not rewritten after --force re-download: installed_at=%q", got.InstalledAt)
+	}
+}
+
 func TestInstall_ChecksumMismatch_PartialFailure(t *testing.T) {
 	rune, _ := setRealms(t)
 	fx := newFixture(t)
@@ -130,12 +130,22 @@ func PlatformTuple() string {
 	return runtime.GOOS + "-" + runtime.GOARCH // {os}-{arch}, e.g. "linux-amd64"
 }
 
+const pluginInstallHint = "`bash -c \"${CLAUDE_PLUGIN_ROOT}/bin/rune install\"`"
+
 func AgentInstallRecoveryHint() string {
 	if paths, err := Resolve(); err == nil {
-		if _, err := os.Stat(paths.RuneCLIBinary); err == nil {
-			return fmt.Sprintf("`%s install`", paths.RuneCLIBinary)
-		}
+		return paths.AgentInstallRecoveryHint()
+	}
+
+	return pluginInstallHint
+}
+
+// Same as the package-level helper, for callers that already hold
+// resolved Paths (avoids a second home-dir lookup)
+func (p *Paths) AgentInstallRecoveryHint() string {
+	if _, err := os.Stat(p.RuneCLIBinary); err == nil {
+		return fmt.Sprintf("`%s install`", p.RuneCLIBinary)
 	}
 
-	return "`bash -c \"${CLAUDE_PLUGIN_ROOT}/bin/rune install\"`"
+	return pluginInstallHint
 }
@@ -119,3 +119,23 @@ func TestPlatformTuple_NonEmpty(t *testing.T) {
 		t.Errorf("PlatformTuple = %q, want <os>-<arch>", got)
 	}
 }
+
+func TestAgentInstallRecoveryHint_PrefersInstalledCLI(t *testing.T) {
+	setRealms(t)
+	p, err := Resolve()
+	if err != nil {
+		t.Fatalf("Resolve: %v", err)
+	}
+
+	if got := p.AgentInstallRecoveryHint(); got != pluginInstallHint {
+		t.Errorf("hint without installed CLI = %q, want plugin fallback", got)
+	}
+
+	writeFakeBinary(t, p.RuneCLIBinary)
+	if got := p.AgentInstallRecoveryHint(); !strings.Contains(got, p.RuneCLIBinary) {
+		t.Errorf("hint = %q, want it to reference %s", got, p.RuneCLIBinary)
+	}
+	if got := AgentInstallRecoveryHint(); got != p.AgentInstallRecoveryHint() {
+		t.Errorf("package helper = %q, want same as Paths method", got)
+	}
+}